@@ -2,17 +2,73 @@
 # Enhanced Amazon Bestsellers Scraper with Universal Selectors and Robust Error Handling
 # Based on comprehensive analysis of Amazon's category page structures
 
+import argparse
 import json
+import logging
+import os
+import sys
 import time
 import re
+import queue
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urljoin
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 import csv
 
+try:
+    import orjson
+except ImportError:  # Optional: JSON output falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as pa_feather
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # Optional: stdlib CSV writer, JSON instead of Feather
+    pa = None
+    pc = None
+    pa_csv = None
+    pa_feather = None
+    pa_ipc = None
+
+log = logging.getLogger(__name__)
+
 BASE_URL = "https://www.amazon.in"
 BESTSELLERS_URL = f"{BASE_URL}/gp/bestsellers/"
 
+# Headless Chromium; flip to headless=False if you want to watch it run
+LAUNCH_OPTIONS = types.MappingProxyType({"headless": True})
+# Using a real browser context helps reduce friction; locale en-IN
+CONTEXT_OPTIONS = types.MappingProxyType({"locale": "en-IN"})
+
+# Every product tile on a bestseller page carries a non-empty data-asin
+ASIN_SELECTOR = '[data-asin]:not([data-asin=""])'
+
+# Patterns used for every extracted product
+_RANK_RE = re.compile(r"#?(\d+)")
+_RATING_PREFIX_RE = re.compile(r"^\d+\.?\d*\s*out\s*of\s*5")
+
+# Requests the extractors never read. Stylesheets are kept because lazy
+# loading on scroll and the left-nav visibility check depend on layout.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_URL_PARTS = ("amazon-adsystem", "fls-na.amazon")
+
+# Number of categories scraped concurrently (one browser per worker thread)
+MAX_WORKERS = 6
+# Page navigations per second allowed across all workers combined
+NAVIGATION_RATE = 5
+
+# Fresh context after this many categories so cookies, caches and page
+# state from earlier categories don't pile up in a long-running browser
+CONTEXT_ROTATE_EVERY = 10
+# Times a worker relaunches a crashed browser to retry the same category
+BROWSER_RELAUNCHES = 1
+
 # -----------------------
 # Utility helpers
 # -----------------------
@@ -26,73 +82,285 @@ def format_duration(seconds):
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
-def save_as_csv(data, filename_prefix="bestsellers"):
-    """Convert the scraped data to CSV format."""
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    csv_filename = f"./data/csv/{filename_prefix}_{ts}.csv"
-
-    csv_rows = []
-    bestsellers_data = data.get("bestsellers", {})
-
-    for sub_category, category_data in bestsellers_data.items():
-        category_link = category_data.get("category_link", "")
-        category_items = category_data.get("category_items", [])
-        extraction_stats = category_data.get("extraction_stats", {})
-
-        for item in category_items:
-            row = {
-                "root_category": "bestseller",
-                "sub_category": sub_category,
-                "category_link": category_link,
-                "rank": item.get("rank", ""),
-                "name": item.get("name", ""),
-                "link": item.get("link", ""),
-                "rating": item.get("rating", ""),
-                "price": item.get("price", ""),
-                "page1_items": extraction_stats.get("page1_items", ""),
-                "page2_items": extraction_stats.get("page2_items", ""),
-                "final_unique_items": extraction_stats.get("final_unique_items", ""),
-            }
-            csv_rows.append(row)
-
-    if csv_rows:
-        fieldnames = [
-            "root_category",
-            "sub_category",
-            "category_link",
-            "rank",
-            "name",
-            "link",
-            "rating",
-            "price",
-            "page1_items",
-            "page2_items",
-            "final_unique_items",
+CSV_FIELDNAMES = [
+    "root_category",
+    "sub_category",
+    "category_link",
+    "rank",
+    "name",
+    "link",
+    "rating",
+    "price",
+    "page1_items",
+    "page2_items",
+    "final_unique_items",
+]
+CSV_COUNT_FIELDS = ("page1_items", "page2_items", "final_unique_items")
+
+if pa is not None:
+    CSV_SCHEMA = pa.schema(
+        [
+            (name, pa.int64() if name in CSV_COUNT_FIELDS else pa.string())
+            for name in CSV_FIELDNAMES
         ]
+    )
+
+
+def category_csv_rows(sub_category, category_data):
+    """Flatten one scraped category into CSV row tuples (CSV_FIELDNAMES order)."""
+    category_link = category_data.get("category_link", "")
+    category_items = category_data.get("category_items", [])
+    extraction_stats = category_data.get("extraction_stats", {})
+
+    # Per-category columns are the same for every item
+    page1_items = extraction_stats.get("page1_items")
+    page2_items = extraction_stats.get("page2_items")
+    final_unique_items = extraction_stats.get("final_unique_items")
+
+    return [
+        (
+            "bestseller",
+            sub_category,
+            category_link,
+            item.get("rank", ""),
+            item.get("name", ""),
+            item.get("link", ""),
+            item.get("rating", ""),
+            item.get("price", ""),
+            page1_items,
+            page2_items,
+            final_unique_items,
+        )
+        for item in category_items
+    ]
+
+
+if pa is not None:
+    # Product fields as scraped, pivoted out of the item dicts in one pass
+    ITEM_SCHEMA = pa.schema(
+        [(name, pa.string()) for name in ("rank", "name", "link", "rating", "price")]
+    )
+    # Typed, dictionary-encoded layout for the Feather (Arrow IPC) output
+    ARROW_SCHEMA = pa.schema(
+        [
+            ("category", pa.dictionary(pa.int16(), pa.string())),
+            ("category_link", pa.string()),
+            ("rank", pa.int32()),
+            ("asin", pa.string()),
+            ("name", pa.string()),
+            ("link", pa.string()),
+            ("rating", pa.string()),
+            ("price", pa.float32()),
+        ]
+    )
+
+
+# RE2 patterns for the vectorized column parsing in category_arrow_table
+ARROW_RANK_PATTERN = r"#?(?P<value>\d+)"
+ARROW_PRICE_PATTERN = r"(?P<value>\d[\d,]*(?:\.\d+)?)"
+ARROW_ASIN_PATTERN = r"/dp/(?P<asin>[A-Z0-9]{10})"
+
+
+def extract_number(values, pattern, to_type):
+    """
+    Parse the first number matching pattern out of each string, in one
+    pyarrow.compute pass per step. Strings without a match become null.
+    """
+    matches = pc.extract_regex(values, pattern)
+    digits = pc.replace_substring(pc.struct_field(matches, "value"), ",", "")
+    return digits.cast(to_type)
+
 
-        with open(csv_filename, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(csv_rows)
+def category_arrow_table(sub_category, category_data):
+    """Build the ARROW_SCHEMA table for one scraped category."""
+    items = pa.Table.from_pylist(
+        category_data.get("category_items", []), schema=ITEM_SCHEMA
+    )
+    n = items.num_rows
 
-        print(f"CSV saved to: {csv_filename}")
-        return csv_filename
+    links = items.column("link")
+    # ASINs come from the /dp/ links in one RE2 pass over the whole column
+    asins = pc.struct_field(pc.extract_regex(links, ARROW_ASIN_PATTERN), "asin")
+
+    columns = [
+        pa.DictionaryArray.from_arrays(
+            pa.array([0] * n, type=pa.int16()), pa.array([sub_category])
+        ),
+        pa.array([category_data.get("category_link", "")] * n, type=pa.string()),
+        extract_number(items.column("rank"), ARROW_RANK_PATTERN, pa.int32()),
+        asins,
+        items.column("name"),
+        links,
+        items.column("rating"),
+        # First value of a range such as '₹299.00 - ₹499.00'
+        extract_number(items.column("price"), ARROW_PRICE_PATTERN, pa.float32()),
+    ]
+    return pa.Table.from_arrays(columns, schema=ARROW_SCHEMA)
+
+
+def open_arrow_stream(filename):
+    """
+    Start an Arrow IPC stream that each category is appended to as it finishes.
+    Returns (writer, sink); closing the writer leaves the sink open.
+    """
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    sink = pa.OSFile(filename, "wb")
+    return pa_ipc.new_stream(sink, ARROW_SCHEMA), sink
+
+
+def arrow_stream_to_feather(stream_filename, filename):
+    """Convert a complete Arrow IPC stream into the Feather output."""
+    with pa.memory_map(stream_filename) as source:
+        with pa_ipc.open_stream(source) as reader:
+            table = reader.read_all()
+    return save_as_feather([table], filename)
+
+
+def save_as_feather(tables, filename):
+    """Concatenate per-category tables and write a zstd-compressed Feather v2 file."""
+    if tables:
+        table = pa.concat_tables(tables).unify_dictionaries()
     else:
-        print("No data to save as CSV")
-        return None
+        table = ARROW_SCHEMA.empty_table()
+    pa_feather.write_feather(table, filename, compression="zstd")
+    return filename
+
+
+def csv_table(rows):
+    """Pivot CSV row tuples into a pyarrow Table with CSV_SCHEMA."""
+    columns = zip(*rows) if rows else ([] for _ in CSV_FIELDNAMES)
+    return pa.Table.from_arrays(
+        [pa.array(col, type=field.type) for col, field in zip(columns, CSV_SCHEMA)],
+        schema=CSV_SCHEMA,
+    )
+
+
+def open_csv_stream(filename):
+    """
+    Start a CSV file that categories are appended to.
+    Returns (write_rows, close) callables.
+    """
+    if pa_csv is not None:
+        f = open(filename, "wb")
+        writer = pa_csv.CSVWriter(f, CSV_SCHEMA)
+
+        def write_rows(rows):
+            if rows:
+                writer.write_table(csv_table(rows))
+            f.flush()
+
+        def close():
+            writer.close()
+            f.close()
+
+    else:
+        f = open(filename, "w", newline="", encoding="utf-8")
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+
+        def write_rows(rows):
+            writer.writerows(rows)
+            f.flush()
+
+        close = f.close
+
+    return write_rows, close
+
+
+def dump_json_bytes(obj):
+    """Pretty-printed UTF-8 JSON, encoded with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+
+
+def open_json_stream(filename):
+    """Start a {"bestsellers": {...}} JSON file that categories are appended to."""
+    f = open(filename, "wb")
+    f.write(b'{\n  "bestsellers": {')
+    return f
+
+
+def write_json_category(f, name, data, first):
+    """Append one category, laid out as json.dump(..., indent=2) would."""
+    body = dump_json_bytes(data).replace(b"\n", b"\n    ")
+    separator = b"\n" if first else b",\n"
+    f.write(separator + b"    " + dump_json_bytes(name) + b": " + body)
+    f.flush()
+
+
+def close_json_stream(f, empty):
+    """Close the bestsellers object and the file."""
+    f.write(b"}\n}" if empty else b"\n  }\n}")
+    f.close()
 
 
 def clean_text(s: str | None) -> str:
     """Clean and normalize text content."""
     if not s:
         return ""
-    # Collapse whitespace/newlines and strip
-    return " ".join(s.split()).strip()
+    s = s.strip()
+    # Most fields are already clean; skip the split/join allocation for them.
+    # isprintable() is False for every whitespace character except " ".
+    if "  " not in s and s.isprintable():
+        return s
+    # Collapse whitespace/newlines
+    return " ".join(s.split())
+
+
+def product_url(href):
+    """Absolute URL for a product href (Amazon emits absolute or root-relative)."""
+    return href if href.startswith("http") else BASE_URL + href
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: at most max_rate acquisitions per time_period
+    seconds, shared by every worker, with bursts of up to max_rate.
+    """
+
+    def __init__(self, max_rate, time_period=1.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._updated = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.perf_counter()
+                refill = (now - self._updated) * self.max_rate / self.time_period
+                self._tokens = min(self.max_rate, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.time_period / self.max_rate
+            time.sleep(wait)
+
+
+# Polite pacing for every page load, shared across worker threads
+navigation_limiter = RateLimiter(NAVIGATION_RATE)
+
+
+def block_unneeded_requests(route):
+    """Abort images, fonts, media and ad/tracking beacons."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
 
 
-def polite_pause(page, ms=1000):
-    """Polite pause for rate limiting."""
-    page.wait_for_timeout(ms)
+def new_scraping_context(browser):
+    """Create an en-IN browser context that skips unneeded downloads."""
+    context = browser.new_context(**CONTEXT_OPTIONS)
+    context.route("**/*", block_unneeded_requests)
+    return context
 
 
 # -----------------------
@@ -115,9 +383,11 @@ def validate_and_clean_items(items):
         validated_item = {
             "rank": clean_rank(item.get("rank", "")),
             "name": clean_product_name(item.get("name", "")),
-            "link": validate_product_link(item.get("link", "")),
+            # Extractors only match a[href*="/dp/"], so links are already valid
+            "link": item.get("link", ""),
             "rating": clean_rating(item.get("rating", "")),
             "price": clean_price(item.get("price", "")),
+            "asin": item.get("asin", ""),  # Kept for deduplicate_products
         }
 
         # Final validation - ensure we have meaningful data
@@ -128,22 +398,15 @@ def validate_and_clean_items(items):
         ):
             validated_items.append(validated_item)
 
-    # Remove duplicates based on product link
-    seen_links = set()
-    unique_items = []
-    for item in validated_items:
-        if item["link"] not in seen_links:
-            seen_links.add(item["link"])
-            unique_items.append(item)
-
-    return unique_items
+    # Duplicates are removed once per category by deduplicate_products
+    return validated_items
 
 
 def clean_rank(rank_text):
     """Clean rank text (e.g., '#1' from 'Best Sellers Rank #1' or '#1')."""
     if not rank_text:
         return ""
-    match = re.search(r"#?(\d+)", rank_text)
+    match = _RANK_RE.search(rank_text)
     return f"#{match.group(1)}" if match else ""
 
 
@@ -156,13 +419,6 @@ def clean_product_name(name):
     return cleaned[:500] if len(cleaned) > 500 else cleaned
 
 
-def validate_product_link(link):
-    """Validate product link format."""
-    if not link or "/dp/" not in link:
-        return ""
-    return link
-
-
 def clean_rating(rating_text):
     """Clean rating text."""
     if not rating_text:
@@ -179,158 +435,72 @@ def clean_price(price_text):
 
 
 # -----------------------
-# Enhanced data extraction helpers
+# Enhanced scrolling and waiting
 # -----------------------
 
 
-def extract_rating_from_container(container):
-    """
-    Extract rating information using multiple fallback strategies.
-    """
-    rating_strategies = [
-        # Strategy 1: aria-label from rating link (most reliable based on analysis)
-        {"selector": 'a[aria-label*="out of 5"]', "method": "aria_label"},
-        # Strategy 2: Star icon with text
-        {"selector": ".a-icon-star-small", "method": "star_icon"},
-        # Strategy 3: Rating text spans
-        {"selector": '[class*="rating"]', "method": "text_content"},
-        # Strategy 4: Any element with rating patterns
-        {
-            "selector": "*",
-            "method": "text_pattern",
-            "pattern": r"(\d+\.?\d*)\s*out\s*of\s*5",
-        },
-    ]
-
-    for strategy in rating_strategies:
-        try:
-            elements = container.locator(strategy["selector"])
-
-            if strategy["method"] == "aria_label":
-                for i in range(min(elements.count(), 3)):  # Check first 3 matches
-                    aria_label = elements.nth(i).get_attribute("aria-label")
-                    if aria_label and "out of 5" in aria_label:
-                        return clean_text(aria_label)
-
-            elif strategy["method"] == "star_icon":
-                # Look for star icon with adjacent text
-                if elements.count() > 0:
-                    star_parent = elements.first.locator("xpath=..")
-                    text = clean_text(star_parent.inner_text())
-                    if text and ("out of" in text or "rating" in text.lower()):
-                        return text
-
-            elif strategy["method"] == "text_content":
-                for i in range(min(elements.count(), 3)):
-                    text = clean_text(elements.nth(i).inner_text())
-                    if text and ("out of" in text or "star" in text.lower()):
-                        return text
-
-            elif strategy["method"] == "text_pattern":
-                container_text = clean_text(container.inner_text())
-                match = re.search(strategy["pattern"], container_text, re.IGNORECASE)
-                if match:
-                    return f"{match.group(1)} out of 5 stars"
-
-        except Exception as e:
-            continue  # Try next strategy
-
-    return ""  # No rating found
-
-
-def extract_price_from_container(container):
-    """
-    Extract price information using multiple fallback strategies.
-    """
-    price_strategies = [
-        # Strategy 1: Current CSS selectors (proven to work)
-        "span._cDEzb_p13n-sc-price_3mJ9Z",
-        # Strategy 2: Generic price classes
-        ".a-price-whole",
-        ".a-price .a-offscreen",
-        '[class*="price"]:not([class*="strike"])',
-        # Strategy 3: Text pattern matching
-        "text_pattern",
-    ]
-
-    for strategy in price_strategies:
-        try:
-            if strategy == "text_pattern":
-                # Extract price using regex pattern
-                container_text = clean_text(container.inner_text())
-                # Pattern for Indian Rupees: ₹1,234.00 or Rs 1,234
-                price_pattern = r"(?:₹|Rs\.?\s*)([0-9,]+(?:\.[0-9]{2})?)"
-                match = re.search(price_pattern, container_text)
-                if match:
-                    return f"₹{match.group(1)}"
-            else:
-                elements = container.locator(strategy)
-                if elements.count() > 0:
-                    price_text = clean_text(elements.first.inner_text())
-                    if price_text and ("₹" in price_text or "Rs" in price_text):
-                        return price_text
-
-        except Exception as e:
-            continue  # Try next strategy
-
-    return ""  # No price found
-
-
-# -----------------------
-# Enhanced scrolling and waiting
-# -----------------------
+ASIN_COUNT_AT_LEAST_JS = (
+    "([selector, n]) => document.querySelectorAll(selector).length >= n"
+)
+
+# Scrolls to the bottom until the ASIN container count has been stable for
+# two iterations (with at least 20 containers), waiting up to pauseMs per
+# scroll for new containers and longer while the page looks nearly empty.
+SCROLL_UNTIL_STABLE_JS = """
+async ([selector, maxScrolls, pauseMs]) => {
+    const count = () => document.querySelectorAll(selector).length;
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const counts = [];
+    let last = 0;
+    let stable = 0;
+    for (let i = 0; i < maxScrolls; i++) {
+        window.scrollTo(0, document.body.scrollHeight);
+        const deadline = Date.now() + pauseMs;
+        while (count() <= last && Date.now() < deadline) {
+            await sleep(100);
+        }
+        const n = count();
+        counts.push(n);
+        if (n > last) {
+            last = n;
+            stable = 0;
+        } else {
+            stable++;
+        }
+        if (stable >= 2 && n >= 20) break;
+        if (n < 10 && i >= 3) await sleep(2000);
+    }
+    return {counts, final: count()};
+}
+"""
 
 
 def scroll_to_bottom_enhanced(page, max_scrolls=8, pause_ms=2000):
     """
     Enhanced scrolling that monitors ASIN container count for completion.
     """
-    print("      Starting enhanced page loading...")
+    log.debug("      Starting enhanced page loading...")
 
-    # Wait for initial page structure
+    # Wait for the first product tiles rather than networkidle, which
+    # Amazon's beacons and lazy loads rarely let the page reach
     try:
-        page.wait_for_load_state("networkidle", timeout=8000)
-        print("      Network idle achieved")
-    except:
-        print("      Network idle timeout, proceeding with scroll")
+        page.wait_for_function(
+            ASIN_COUNT_AT_LEAST_JS, arg=[ASIN_SELECTOR, 10], timeout=8000
+        )
+        log.debug("      Initial products rendered")
+    except PlaywrightTimeoutError:
+        log.debug("      Initial product wait timed out, proceeding with scroll")
         page.wait_for_load_state("domcontentloaded", timeout=15000)
 
-    # Progressive scroll with container monitoring
-    last_asin_count = 0
-    stable_iterations = 0
-
-    for scroll_num in range(max_scrolls):
-        # Scroll to bottom
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        page.wait_for_timeout(pause_ms)
-
-        # Check current ASIN container count
-        current_asin_count = page.locator('[data-asin]:not([data-asin=""])').count()
-
-        if current_asin_count > last_asin_count:
-            print(
-                f"      Scroll {scroll_num + 1}: {current_asin_count} ASIN containers"
-            )
-            last_asin_count = current_asin_count
-            stable_iterations = 0
-        else:
-            stable_iterations += 1
-            print(
-                f"      Scroll {scroll_num + 1}: {current_asin_count} containers (stable)"
-            )
-
-        # Stop if content has been stable for 2 iterations and we have reasonable content
-        if stable_iterations >= 2 and current_asin_count >= 20:
-            print("      Content stabilized, stopping scroll")
-            break
-
-        # If very few containers after several scrolls, wait longer
-        if current_asin_count < 10 and scroll_num >= 3:
-            print("      Low container count, extending wait...")
-            page.wait_for_timeout(2000)
+    # Progressive scroll with container monitoring, run entirely in the page
+    scroll = page.evaluate(
+        SCROLL_UNTIL_STABLE_JS, [ASIN_SELECTOR, max_scrolls, pause_ms]
+    )
+    counts = " -> ".join(str(n) for n in scroll["counts"])
+    log.debug("      Scrolled %s times, containers: %s", len(scroll["counts"]), counts)
 
-    final_count = page.locator('[data-asin]:not([data-asin=""])').count()
-    print(f"      Enhanced loading complete: {final_count} ASIN containers")
+    final_count = scroll["final"]
+    log.debug("      Enhanced loading complete: %s ASIN containers", final_count)
 
     return final_count
 
@@ -340,63 +510,71 @@ def scroll_to_bottom_enhanced(page, max_scrolls=8, pause_ms=2000):
 # -----------------------
 
 
-def extract_from_asin_containers_universal(asin_containers):
+# Reads every ASIN container in a single round-trip instead of issuing
+# locator calls per field. All candidate product links are returned so the
+# name filtering below stays in Python.
+ASIN_CONTAINERS_JS = """
+([selector, limit]) => [...document.querySelectorAll(selector)]
+    .slice(0, limit)
+    .map(el => {
+        const rank = el.querySelector('.zg-bdg-text');
+        const rating = el.querySelector('a[aria-label*="out of 5"]');
+        const price = el.querySelector('span._cDEzb_p13n-sc-price_3mJ9Z');
+        return {
+            asin: el.getAttribute('data-asin'),
+            links: [...el.querySelectorAll('a.a-link-normal[href*="/dp/"]')]
+                .map(a => ({name: a.innerText, href: a.getAttribute('href')})),
+            rank: rank ? rank.innerText : '',
+            rating: rating ? rating.getAttribute('aria-label') : '',
+            price: price ? price.innerText : '',
+        };
+    })
+"""
+
+
+def extract_from_asin_containers_universal(page):
     """
     Extract using ASIN containers with universal selectors proven to work across categories.
     Based on selector analysis showing these work for Books, Apps & Games, and other categories.
     """
     items = []
-    container_count = asin_containers.count()
+    containers = page.evaluate(ASIN_CONTAINERS_JS, [ASIN_SELECTOR, 100])
 
-    for i in range(min(container_count, 100)):
+    for i, container in enumerate(containers):
         try:
-            container = asin_containers.nth(i)
-            asin = container.get_attribute("data-asin")
+            asin = container["asin"]
 
             # Universal product name and link extraction
             name = ""
             link = ""
 
             # Use the universal selector: a.a-link-normal[href*="/dp/"] (90 matches in analysis)
-            link_elements = container.locator('a.a-link-normal[href*="/dp/"]')
-
-            if link_elements.count() > 0:
-                # Get the first valid link element that contains product name
-                for j in range(link_elements.count()):
-                    link_elem = link_elements.nth(j)
-                    potential_name = clean_text(link_elem.inner_text())
-                    href = link_elem.get_attribute("href")
-
-                    # Filter out rating links and other non-product links
-                    # Product names should be substantial (>15 chars) and not contain only rating info
-                    if (
-                        potential_name
-                        and len(potential_name) > 15
-                        and href
-                        and not re.search(r"^\d+\.?\d*\s*out\s*of\s*5", potential_name)
-                        and "star" not in potential_name.lower()
-                    ):
-                        name = potential_name
-                        link = urljoin(BASE_URL, href)
-                        break
+            # Get the first valid link element that contains product name
+            for link_elem in container["links"]:
+                potential_name = clean_text(link_elem["name"])
+                href = link_elem["href"]
+
+                # Filter out rating links and other non-product links
+                # Product names should be substantial (>15 chars) and not contain only rating info
+                if (
+                    potential_name
+                    and len(potential_name) > 15
+                    and href
+                    and not _RATING_PREFIX_RE.search(potential_name)
+                    and "star" not in potential_name.lower()
+                ):
+                    name = potential_name
+                    link = product_url(href)
+                    break
 
             # Universal rank extraction (.zg-bdg-text works everywhere - 30 matches)
-            rank = ""
-            rank_elem = container.locator(".zg-bdg-text").first
-            if rank_elem.count() > 0:
-                rank = clean_text(rank_elem.inner_text())
+            rank = clean_text(container["rank"])
 
             # Universal rating extraction (a[aria-label*="out of 5"] - 25-29 matches)
-            rating = ""
-            rating_elem = container.locator('a[aria-label*="out of 5"]').first
-            if rating_elem.count() > 0:
-                rating = clean_text(rating_elem.get_attribute("aria-label"))
+            rating = clean_text(container["rating"])
 
             # Universal price extraction (span._cDEzb_p13n-sc-price_3mJ9Z - 30 matches)
-            price = ""
-            price_elem = container.locator("span._cDEzb_p13n-sc-price_3mJ9Z").first
-            if price_elem.count() > 0:
-                price = clean_text(price_elem.inner_text())
+            price = clean_text(container["price"])
 
             # Only add items with essential data
             if name and link and len(name) > 15:  # Ensure we have a real product name
@@ -412,12 +590,29 @@ def extract_from_asin_containers_universal(asin_containers):
                 )
 
         except Exception as e:
-            print(f"      Warning: Container {i} extraction failed: {e}")
+            log.warning("      Warning: Container %s extraction failed: %s", i, e)
             continue
 
     return items
 
 
+# Collects every universal-selector match on the page in one pass for the
+# position-correlated fallback extractor.
+UNIVERSAL_SELECTORS_JS = """
+() => {
+    const all = (selector) => [...document.querySelectorAll(selector)];
+    return {
+        links: all('a.a-link-normal[href*="/dp/"]')
+            .map(a => ({name: a.innerText, href: a.getAttribute('href')})),
+        ranks: all('.zg-bdg-text').map(el => el.innerText),
+        prices: all('span._cDEzb_p13n-sc-price_3mJ9Z').map(el => el.innerText),
+        ratings: all('a[aria-label*="out of 5"]')
+            .map(a => a.getAttribute('aria-label')),
+    };
+}
+"""
+
+
 def extract_using_universal_selectors(page):
     """
     Fallback method using universal selectors without container correlation.
@@ -425,75 +620,52 @@ def extract_using_universal_selectors(page):
     """
     items = []
 
-    # Get all product links (universal selector - 90 matches in analysis)
-    product_links = page.locator('a.a-link-normal[href*="/dp/"]')
-    rank_badges = page.locator(".zg-bdg-text")  # 30 matches
-    price_spans = page.locator("span._cDEzb_p13n-sc-price_3mJ9Z")  # 30 matches
-    rating_links = page.locator('a[aria-label*="out of 5"]')  # 25-29 matches
+    # Get all product links (universal selector - 90 matches in analysis),
+    # rank badges (30), prices (30) and ratings (25-29) in a single call
+    matches = page.evaluate(UNIVERSAL_SELECTORS_JS)
+    rank_badges = matches["ranks"]
+    price_spans = matches["prices"]
+    rating_links = matches["ratings"]
 
-    link_count = product_links.count()
-    print(f"      Universal fallback: {link_count} product links found")
+    log.debug(
+        "      Universal fallback: %s product links found", len(matches["links"])
+    )
 
     # Filter to get actual product name links (not rating links, etc.)
     valid_product_links = []
-    for i in range(link_count):
-        try:
-            link_elem = product_links.nth(i)
-            text = clean_text(link_elem.inner_text())
-            href = link_elem.get_attribute("href")
-
-            # Filter criteria: meaningful text length, valid href, not a rating link
-            if (
-                text
-                and len(text) > 15
-                and href
-                and "/dp/" in href
-                and not re.search(r"^\d+\.?\d*\s*out\s*of\s*5", text)
-                and "star" not in text.lower()
-            ):
-                valid_product_links.append(
-                    {
-                        "element": link_elem,
-                        "name": text,
-                        "link": urljoin(BASE_URL, href),
-                        "index": i,
-                    }
-                )
-        except:
-            continue
+    for link_elem in matches["links"]:
+        text = clean_text(link_elem["name"])
+        href = link_elem["href"]
 
-    print(f"      Filtered to {len(valid_product_links)} valid product links")
+        # Filter criteria: meaningful text length, valid href, not a rating link
+        if (
+            text
+            and len(text) > 15
+            and href
+            and "/dp/" in href
+            and not _RATING_PREFIX_RE.search(text)
+            and "star" not in text.lower()
+        ):
+            valid_product_links.append({"name": text, "link": product_url(href)})
 
-    # Extract data for valid products (up to 50 per page)
-    for idx, product_data in enumerate(valid_product_links[:50]):
-        try:
-            # Rank (try to correlate by position)
-            rank = ""
-            if rank_badges.count() > idx:
-                rank = clean_text(rank_badges.nth(idx).inner_text())
-
-            # Price (try to correlate by position)
-            price = ""
-            if price_spans.count() > idx:
-                price = clean_text(price_spans.nth(idx).inner_text())
-
-            # Rating (try to correlate by position)
-            rating = ""
-            if rating_links.count() > idx:
-                rating = clean_text(rating_links.nth(idx).get_attribute("aria-label"))
-
-            items.append(
-                {
-                    "rank": rank,
-                    "name": product_data["name"],
-                    "link": product_data["link"],
-                    "rating": rating,
-                    "price": price,
-                }
-            )
+    log.debug("      Filtered to %s valid product links", len(valid_product_links))
 
-        except Exception as e:
-            continue
+    # Extract data for valid products (up to 50 per page), correlating
+    # rank, price and rating by position
+    for idx, product_data in enumerate(valid_product_links[:50]):
+        rank = clean_text(rank_badges[idx]) if idx < len(rank_badges) else ""
+        price = clean_text(price_spans[idx]) if idx < len(price_spans) else ""
+        rating = clean_text(rating_links[idx]) if idx < len(rating_links) else ""
+
+        items.append(
+            {
+                "rank": rank,
+                "name": product_data["name"],
+                "link": product_data["link"],
+                "rating": rating,
+                "price": price,
+            }
+        )
 
     return items
 
@@ -503,34 +675,32 @@ def extract_products_on_page(page):
     Universal product extraction using the most reliable selectors found across all categories.
     Uses ASIN containers with proven universal selectors.
     """
-    # Enhanced scroll and wait
-    final_container_count = scroll_to_bottom_enhanced(page)
+    # Enhanced scroll and wait; returns the ASIN container count it settled on
+    container_count = scroll_to_bottom_enhanced(page)
 
     items = []
 
     # Method 1: ASIN-based extraction (Universal - works everywhere)
-    asin_containers = page.locator('[data-asin]:not([data-asin=""])')
-    container_count = asin_containers.count()
-
-    print(f"      Found {container_count} ASIN containers")
+    log.debug("      Found %s ASIN containers", container_count)
 
     if container_count >= 10:
-        items = extract_from_asin_containers_universal(asin_containers)
-        print(f"      ASIN method: {len(items)} items extracted")
+        items = extract_from_asin_containers_universal(page)
+        log.debug("      ASIN method: %s items extracted", len(items))
 
     # Method 2: Fallback using universal selectors (if ASIN method fails)
     if len(items) < 15:  # Threshold for insufficient data
-        print(
-            f"      ASIN method insufficient ({len(items)} items), using universal fallback"
+        log.debug(
+            "      ASIN method insufficient (%s items), using universal fallback",
+            len(items),
         )
         fallback_items = extract_using_universal_selectors(page)
         if len(fallback_items) > len(items):
             items = fallback_items
-            print(f"      Universal method: {len(items)} items extracted")
+            log.debug("      Universal method: %s items extracted", len(items))
 
     # Final validation and cleanup
     validated_items = validate_and_clean_items(items)
-    print(f"      Final validated items: {len(validated_items)}")
+    log.debug("      Final validated items: %s", len(validated_items))
 
     return validated_items
 
@@ -545,23 +715,25 @@ def navigate_to_next_page(page):
     Enhanced next page navigation with multiple strategies.
     """
     navigation_strategies = [
-        # Strategy 1: Text-based navigation (most reliable)
-        lambda: page.get_by_text("Next page").click(timeout=5000),
-        # Strategy 2: Specific next page link
-        lambda: page.locator('a[href*="pg=2"]').first.click(timeout=5000),
-        # Strategy 3: Generic pagination link
+        # Strategy 1: Direct URL navigation (works for every pg= listing)
+        lambda: navigate_by_url_modification(page),
+        # Strategy 2: Text-based navigation
+        lambda: page.get_by_text("Next page").click(timeout=2000),
+        # Strategy 3: Specific next page link
+        lambda: page.locator('a[href*="pg=2"]').first.click(timeout=2000),
+        # Strategy 4: Generic pagination link
         lambda: page.locator('a[href*="pg="]:has-text("Next")').first.click(
-            timeout=5000
+            timeout=2000
         ),
-        # Strategy 4: Arrow or symbol navigation
-        lambda: page.locator('a[href*="pg="] .a-icon-next').first.click(timeout=5000),
-        # Strategy 5: Direct URL navigation (backup)
-        lambda: navigate_by_url_modification(page),
+        # Strategy 5: Arrow or symbol navigation
+        lambda: page.locator('a[href*="pg="] .a-icon-next').first.click(timeout=2000),
     ]
 
     for i, strategy in enumerate(navigation_strategies):
         try:
-            print(f"        Trying navigation strategy {i+1}")
+            log.debug("        Trying navigation strategy %s", i + 1)
+            if i > 0:  # Strategy 1 acquires inside navigate_by_url_modification
+                navigation_limiter.acquire()
             strategy()
 
             # Wait for navigation to complete
@@ -570,27 +742,27 @@ def navigate_to_next_page(page):
             # Verify we're on page 2 by checking URL or content
             current_url = page.url
             if "pg=2" in current_url or "page=2" in current_url:
-                print(f"        Navigation successful (URL confirmation)")
+                log.debug("        Navigation successful (URL confirmation)")
                 return True
 
             # Alternative verification: check if ASIN containers reloaded
             page.wait_for_timeout(2000)
-            new_containers = page.locator('[data-asin]:not([data-asin=""])').count()
+            new_containers = page.locator(ASIN_SELECTOR).count()
             if new_containers >= 10:
-                print(f"        Navigation successful (content confirmation)")
+                log.debug("        Navigation successful (content confirmation)")
                 return True
 
         except Exception as e:
-            print(f"        Strategy {i+1} failed: {str(e)}")
+            log.debug("        Strategy %s failed: %s", i + 1, e)
             continue
 
-    print(f"        All navigation strategies failed")
+    log.warning("        All navigation strategies failed")
     return False
 
 
 def navigate_by_url_modification(page):
     """
-    Backup navigation by modifying URL directly.
+    Navigate to page 2 by rewriting the pg= parameter of the current URL.
     """
     current_url = page.url
 
@@ -605,36 +777,46 @@ def navigate_by_url_modification(page):
         separator = "&" if "?" in current_url else "?"
         new_url = f"{current_url}{separator}pg=2"
 
-    print(f"        Attempting direct URL navigation to: {new_url}")
+    log.debug("        Attempting direct URL navigation to: %s", new_url)
+    navigation_limiter.acquire()
     page.goto(new_url, wait_until="domcontentloaded", timeout=15000)
 
 
 def deduplicate_products(items):
     """
     Advanced deduplication using multiple criteria.
+    A duplicate's non-empty fields fill gaps in the record kept first.
     """
-    seen_links = set()
-    seen_asins = set()
+    by_asin = {}
+    by_link = {}
     unique_items = []
 
     for item in items:
         link = item.get("link", "")
-        asin = item.get("asin", "")
+        # Remove ASIN from final output (it was just for deduplication)
+        asin = item.pop("asin", "")
 
-        # Create deduplication key
-        dedup_key = None
+        if not asin and not link:
+            continue
+
+        # Distinct ASINs are distinct products even when their links match;
+        # only ASIN-less items fall back to the link
+        if asin:
+            kept = by_asin.get(asin)
+        else:
+            kept = by_link.get(link)
 
-        if asin and asin not in seen_asins:
-            dedup_key = f"asin:{asin}"
-            seen_asins.add(asin)
-        elif link and link not in seen_links:
-            dedup_key = f"link:{link}"
-            seen_links.add(link)
+        if kept is not None:
+            for key, value in item.items():
+                if value and not kept.get(key):
+                    kept[key] = value
+            continue
 
-        if dedup_key:
-            # Remove ASIN from final output (it was just for deduplication)
-            clean_item = {k: v for k, v in item.items() if k != "asin"}
-            unique_items.append(clean_item)
+        if asin:
+            by_asin[asin] = item
+        if link:
+            by_link.setdefault(link, item)
+        unique_items.append(item)
 
     return unique_items
 
@@ -668,8 +850,15 @@ def deduplicate_products(items):
 #     return categories
 
 
+CATEGORY_LINKS_JS = (
+    "ul => [...ul.querySelectorAll('li a')]"
+    ".map(a => ({name: a.innerText, href: a.getAttribute('href')}))"
+)
+
+
 def get_categories(page):
     """Scrape category names + links from the left nav (robust selector strategy)."""
+    navigation_limiter.acquire()
     page.goto(BESTSELLERS_URL, wait_until="domcontentloaded")
 
     # Give the client-side nav a moment to initialize
@@ -706,17 +895,16 @@ def get_categories(page):
             f"Left nav container not found. Tried: {container_selectors}. Last error: {last_err}"
         )
 
-    print(f"Using left-nav selector: {chosen}")
+    log.info("Using left-nav selector: %s", chosen)
 
-    anchors = container.locator("li a")
-    count = anchors.count()
-    print(f"Found {count} category links in left nav")
+    # Read every anchor's text and href in a single round-trip
+    anchors = container.evaluate(CATEGORY_LINKS_JS)
+    log.info("Found %s category links in left nav", len(anchors))
 
     categories = []
-    for i in range(count):
-        a = anchors.nth(i)
-        name = clean_text(a.inner_text())
-        href = a.get_attribute("href")
+    for a in anchors:
+        name = clean_text(a["name"])
+        href = a["href"]
         if not name or not href:
             continue
         url = urljoin(BASE_URL, href)
@@ -733,31 +921,34 @@ def scrape_category(page, category):
     category_name = category["name"]
     category_url = category["url"]
 
-    print(f"    Navigating to: {category_url}")
+    log.debug("    Navigating to: %s", category_url)
 
     try:
         # Navigate with extended timeout for problematic categories
+        navigation_limiter.acquire()
         page.goto(category_url, wait_until="domcontentloaded", timeout=30000)
 
         # Initial wait and page assessment
         page.wait_for_timeout(2000)
 
         # Check if page loaded properly by looking for ASIN containers
-        initial_asin_count = page.locator('[data-asin]:not([data-asin=""])').count()
-        print(f"    Initial ASIN containers detected: {initial_asin_count}")
+        asin_containers = page.locator(ASIN_SELECTOR)
+        initial_asin_count = asin_containers.count()
+        log.info("    Initial ASIN containers detected: %s", initial_asin_count)
 
         # If very few containers, try refreshing once
         if initial_asin_count < 5:
-            print(f"    Low container count, attempting page refresh...")
+            log.warning("    Low container count, attempting page refresh...")
+            navigation_limiter.acquire()
             page.reload(wait_until="domcontentloaded", timeout=20000)
             page.wait_for_timeout(3000)
-            initial_asin_count = page.locator('[data-asin]:not([data-asin=""])').count()
-            print(f"    After refresh: {initial_asin_count} ASIN containers")
+            initial_asin_count = asin_containers.count()
+            log.info("    After refresh: %s ASIN containers", initial_asin_count)
 
         # Page 1 extraction (items 1-50)
-        print(f"    Extracting page 1 products...")
+        log.debug("    Extracting page 1 products...")
         first_batch = extract_products_on_page(page)
-        print(f"    Page 1: extracted {len(first_batch)} items")
+        log.info("    Page 1: extracted %s items", len(first_batch))
 
         # Page 2 extraction (items 51-100)
         second_batch = []
@@ -766,22 +957,23 @@ def scrape_category(page, category):
         if (
             len(first_batch) >= 15
         ):  # Only try page 2 if page 1 was reasonably successful
-            print(f"    Attempting to navigate to page 2...")
+            log.debug("    Attempting to navigate to page 2...")
 
             if navigate_to_next_page(page):
-                print(f"    Successfully navigated to page 2")
+                log.info("    Successfully navigated to page 2")
 
                 # Wait for page 2 to load
                 page.wait_for_timeout(2000)
 
                 # Extract page 2 products
                 second_batch = extract_products_on_page(page)
-                print(f"    Page 2: extracted {len(second_batch)} items")
+                log.info("    Page 2: extracted %s items", len(second_batch))
             else:
-                print(f"    Page 2 navigation failed or not available")
+                log.info("    Page 2 navigation failed or not available")
         else:
-            print(
-                f"    Skipping page 2 due to insufficient page 1 results ({len(first_batch)} items)"
+            log.info(
+                "    Skipping page 2 due to insufficient page 1 results (%s items)",
+                len(first_batch),
             )
 
         # Combine and deduplicate results
@@ -793,11 +985,11 @@ def scrape_category(page, category):
         # Final validation and limiting
         final_items = unique_items[:100]  # Ensure max 100 items
 
-        print(f"    Final results: {len(final_items)} unique items")
+        log.info("    Final results: %s unique items", len(final_items))
 
         # Validate minimum expectations
         if len(final_items) < 10:
-            print(f"    WARNING: Low item count for {category_name}")
+            log.warning("    WARNING: Low item count for %s", category_name)
 
         return {
             "category_link": category_url,
@@ -812,7 +1004,7 @@ def scrape_category(page, category):
         }
 
     except Exception as e:
-        print(f"    ERROR: Failed to scrape {category_name}: {str(e)}")
+        log.error("    ERROR: Failed to scrape %s: %s", category_name, e)
 
         # Return minimal structure to avoid breaking the overall process
         return {
@@ -833,118 +1025,319 @@ def scrape_category(page, category):
 # -----------------------
 
 
+def run_category_worker(jobs, on_result, stop):
+    """
+    Scrape categories from a shared queue until it is drained or stop is set.
+    Playwright's sync API is bound to the thread that started it, so every
+    worker owns its own driver, browser and context, and relaunches the
+    browser itself if it crashes.
+    """
+    with sync_playwright() as p:
+        browser = None
+        scraped = 0
+        try:
+            while not stop.is_set():
+                try:
+                    idx, cat = jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+                category_start = time.perf_counter()
+                log.info("[%s] Scraping: %s", idx, cat["name"])
+
+                # scrape_category turns errors into empty results, so a crashed
+                # browser is only noticed through is_connected()
+                try:
+                    for _ in range(BROWSER_RELAUNCHES + 1):
+                        if browser is None or not browser.is_connected():
+                            if browser is not None:
+                                log.warning("    Browser disconnected, relaunching")
+                            browser = p.chromium.launch(**LAUNCH_OPTIONS)
+                            context = new_scraping_context(browser)
+                            page = context.new_page()
+                            scraped = 0
+                        elif scraped and scraped % CONTEXT_ROTATE_EVERY == 0:
+                            context.close()
+                            context = new_scraping_context(browser)
+                            page = context.new_page()
+                        scraped += 1
+
+                        error = None
+                        try:
+                            data = scrape_category(page, cat)
+                        except Exception as e:
+                            data, error = None, e
+                        # Ctrl-C reaches the browsers too; don't relaunch them
+                        if browser.is_connected() or stop.is_set():
+                            break
+                    else:
+                        data, error = None, RuntimeError("browser disconnected")
+                except Exception as e:
+                    # No browser to scrape with, so this worker is done
+                    category_time = time.perf_counter() - category_start
+                    on_result(idx, cat, None, category_time, e)
+                    raise
+
+                on_result(idx, cat, data, time.perf_counter() - category_start, error)
+        finally:
+            if browser is not None:
+                if browser.is_connected():
+                    context.close()
+                browser.close()
+
+
+BAR = "=" * 60
+
+# Summary of improvements, printed after every run
+ENHANCEMENT_SUMMARY = "\n".join(
+    [
+        "",
+        BAR,
+        "ENHANCEMENT SUMMARY",
+        BAR,
+        "• Universal ASIN-based extraction",
+        "• Multi-strategy fallback selectors",
+        "• Enhanced page loading detection",
+        "• Advanced deduplication logic",
+        "• Robust error handling per category",
+        "• Detailed extraction statistics",
+        BAR,
+        "",
+    ]
+)
+
+
 def main():
-    start_time = time.time()
-    result = {"bestsellers": {}}
+    parser = argparse.ArgumentParser(description="Scrape Amazon India bestsellers.")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="also write the JSON output (always written without pyarrow)",
+    )
+    parser.add_argument("--csv", action="store_true", help="also write the CSV output")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"categories scraped concurrently (default: {MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="also log per-scroll and per-strategy details",
+    )
+    args = parser.parse_args()
+
+    # Per-scroll and per-strategy details are logged at DEBUG. Workers log
+    # concurrently, so every line names the thread it came from
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="[%(threadName)s] %(message)s",
+        stream=sys.stdout,
+    )
+
+    start_time = time.perf_counter()
 
     with sync_playwright() as p:
-        # Headless Chromium; flip to headless=False if you want to watch it run
-        browser = p.chromium.launch(headless=True)
-        # Using a real browser context helps reduce friction; locale en-IN
-        context = browser.new_context(locale="en-IN")
+        browser = p.chromium.launch(**LAUNCH_OPTIONS)
+        context = new_scraping_context(browser)
         page = context.new_page()
 
-        print("Loading categories…")
-        categories_start = time.time()
+        log.info("Loading categories…")
+        categories_start = time.perf_counter()
         categories = get_categories(page)
-        categories_time = time.time() - categories_start
-        print(f"Found {len(categories)} categories (took {categories_time:.2f}s)")
+        categories_time = time.perf_counter() - categories_start
+        log.info("Found %s categories (took %.2fs)", len(categories), categories_time)
 
-        total_items = 0
-        successful_categories = 0
-        failed_categories = 0
+        browser.close()
 
-        for idx, cat in enumerate(categories, start=1):
-            try:
-                category_start = time.time()
-                print(f"[{idx}/{len(categories)}] Scraping: {cat['name']}")
-
-                data = scrape_category(page, cat)
-                result["bestsellers"][cat["name"]] = data
-
-                category_time = time.time() - category_start
-                items_count = len(data.get("category_items", []))
-                total_items += items_count
-
-                if items_count > 0:
-                    successful_categories += 1
-                    status = "✓"
-                else:
-                    failed_categories += 1
-                    status = "✗"
-
-                # Show extraction stats
-                stats = data.get("extraction_stats", {})
-                page1_items = stats.get("page1_items", 0)
-                page2_items = stats.get("page2_items", 0)
-
-                print(
-                    f"  {status} Got {items_count} items in {category_time:.2f}s (P1:{page1_items}, P2:{page2_items})"
+    # Results are written as each category finishes, so a crash keeps
+    # everything scraped so far and nothing accumulates in memory
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"./data/json/bestsellers_updated_{ts}.json"
+    csv_filename = f"./data/csv/bestsellers_updated_{ts}.csv"
+    arrow_filename = f"./data/arrow/bestsellers_updated_{ts}.arrow"
+    # Crash-safe record of finished categories, converted to Feather at the end
+    arrow_stream_filename = f"{arrow_filename}s"
+
+    # Feather is the primary output; CSV is opt-in, and so is JSON unless
+    # pyarrow is missing
+    write_json = args.json or pa is None
+    arrow_writer, arrow_sink = (
+        open_arrow_stream(arrow_stream_filename) if pa is not None else (None, None)
+    )
+
+    json_file = open_json_stream(filename) if write_json else None
+    write_csv_rows, close_csv = (
+        open_csv_stream(csv_filename) if args.csv else (None, None)
+    )
+
+    progress = {
+        "done": 0,
+        "written": 0,
+        "total_items": 0,
+        "successful": 0,
+        "failed": 0,
+        "csv_time": 0.0,
+        "closed": False,
+    }
+    progress_lock = threading.Lock()
+
+    def on_result(idx, cat, data, category_time, error=None):
+        with progress_lock:
+            if progress["closed"]:
+                return
+            progress["done"] += 1
+            done = progress["done"]
+
+            if error is not None:
+                progress["failed"] += 1
+                log.error(
+                    "  ✗ Error scraping %s after %.2fs: %s",
+                    cat["name"],
+                    category_time,
+                    error,
                 )
+                return
 
-                # Calculate and display progress
-                elapsed = time.time() - start_time
-                avg_time_per_category = elapsed / idx
-                estimated_total = avg_time_per_category * len(categories)
-                remaining_time = estimated_total - elapsed
-
-                print(
-                    f"  Progress: {idx}/{len(categories)} categories | "
-                    f"Elapsed: {format_duration(elapsed)} | "
-                    f"ETA: {format_duration(remaining_time)}"
+            if json_file:
+                write_json_category(
+                    json_file, cat["name"], data, first=progress["written"] == 0
                 )
+            if arrow_writer:
+                arrow_writer.write_table(category_arrow_table(cat["name"], data))
+            progress["written"] += 1
 
-                # Be a polite guest
-                polite_pause(page, ms=1500 + (idx % 3) * 300)
+            if write_csv_rows:
+                csv_start = time.perf_counter()
+                write_csv_rows(category_csv_rows(cat["name"], data))
+                progress["csv_time"] += time.perf_counter() - csv_start
 
-            except Exception as e:
-                category_time = time.time() - category_start
-                failed_categories += 1
-                print(
-                    f"  ✗ Error scraping {cat['name']} after {category_time:.2f}s: {e}"
-                )
+            items_count = len(data.get("category_items", []))
+            progress["total_items"] += items_count
 
-        browser.close()
+            if items_count > 0:
+                progress["successful"] += 1
+                status = "✓"
+            else:
+                progress["failed"] += 1
+                status = "✗"
+
+            # Show extraction stats
+            stats = data.get("extraction_stats", {})
+            page1_items = stats.get("page1_items", 0)
+            page2_items = stats.get("page2_items", 0)
+
+            log.info(
+                "  %s [%s/%s] %s: Got %s items in %.2fs (P1:%s, P2:%s)",
+                status,
+                idx,
+                len(categories),
+                cat["name"],
+                items_count,
+                category_time,
+                page1_items,
+                page2_items,
+            )
 
-    # Save JSON with timestamped filename
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"./data/json/bestsellers_updated_{ts}.json"
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+            # Calculate and display progress
+            elapsed = time.perf_counter() - start_time
+            avg_time_per_category = elapsed / done
+            estimated_total = avg_time_per_category * len(categories)
+            remaining_time = estimated_total - elapsed
+
+            log.info(
+                "  Progress: %s/%s categories | Elapsed: %s | ETA: %s",
+                done,
+                len(categories),
+                format_duration(elapsed),
+                format_duration(remaining_time),
+            )
+
+    jobs = queue.Queue()
+    for idx, cat in enumerate(categories, start=1):
+        jobs.put((idx, cat))
+
+    workers = max(1, min(args.workers, len(categories)))
+    log.info("Scraping %s categories with %s workers", len(categories), workers)
+
+    stop = threading.Event()
+    try:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="scraper"
+        ) as executor:
+            try:
+                futures = [
+                    executor.submit(run_category_worker, jobs, on_result, stop)
+                    for _ in range(workers)
+                ]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        # Only raised when a worker could not relaunch its browser
+                        log.error("  ✗ Worker stopped: %s", e)
+            except BaseException:
+                # Ctrl-C: workers finish the category in hand and exit, and
+                # leaving the with block waits for them
+                log.warning("Stopping after the categories in progress…")
+                stop.set()
+                raise
+        # Left over only if no worker could launch a browser
+        if not jobs.empty():
+            progress["failed"] += jobs.qsize()
+            log.error("  ✗ %s categories left unscraped", jobs.qsize())
+    finally:
+        # A second Ctrl-C lands here while workers may still be running, so
+        # the outputs are closed under the lock and on_result stops writing
+        with progress_lock:
+            progress["closed"] = True
+            if json_file:
+                close_json_stream(json_file, empty=progress["written"] == 0)
+            if close_csv:
+                close_csv()
+            if arrow_writer:
+                arrow_writer.close()
+                arrow_sink.close()
+
+    if arrow_writer:
+        arrow_stream_to_feather(arrow_stream_filename, arrow_filename)
+        os.remove(arrow_stream_filename)
+
+    total_items = progress["total_items"]
+    successful_categories = progress["successful"]
+    failed_categories = progress["failed"]
 
     # Calculate final timing statistics
-    total_time = time.time() - start_time
-
-    print(f"\n{'='*60}")
-    print(f"ENHANCED SCRAPING COMPLETED")
-    print(f"{'='*60}")
-    print(f"Total time: {format_duration(total_time)}")
-    print(f"Categories processed: {successful_categories}/{len(categories)} successful")
-    print(f"Failed categories: {failed_categories}")
-    print(f"Total items scraped: {total_items}")
-    print(f"Average time per category: {total_time/len(categories):.2f}s")
-    print(f"Average items per second: {total_items/total_time:.2f}")
-    print(f"JSON saved to: {filename}")
-
-    # Also save as CSV
-    csv_start = time.time()
-    csv_file = save_as_csv(result, "bestsellers_updated")
-    csv_time = time.time() - csv_start
-
-    if csv_file:
-        print(f"CSV saved to: {csv_file} (took {csv_time:.2f}s)")
-
-    # Summary of improvements
-    print(f"\n{'='*60}")
-    print(f"ENHANCEMENT SUMMARY")
-    print(f"{'='*60}")
-    print(f"• Universal ASIN-based extraction")
-    print(f"• Multi-strategy fallback selectors")
-    print(f"• Enhanced page loading detection")
-    print(f"• Advanced deduplication logic")
-    print(f"• Robust error handling per category")
-    print(f"• Detailed extraction statistics")
-    print(f"{'='*60}")
+    total_time = time.perf_counter() - start_time
+    n_categories = len(categories)
+    avg_time_per_category = total_time / n_categories if n_categories else 0
+    items_per_second = total_items / total_time if total_time else 0
+
+    # Build the summary in memory and emit it with a single write
+    lines = [
+        "",
+        BAR,
+        "ENHANCED SCRAPING COMPLETED",
+        BAR,
+        f"Total time: {format_duration(total_time)}",
+        f"Categories processed: {successful_categories}/{n_categories} successful",
+        f"Failed categories: {failed_categories}",
+        f"Total items scraped: {total_items}",
+        f"Average time per category: {avg_time_per_category:.2f}s",
+        f"Average items per second: {items_per_second:.2f}",
+    ]
+    if pa is not None:
+        lines.append(f"Feather saved to: {arrow_filename}")
+    if write_json:
+        lines.append(f"JSON saved to: {filename}")
+    if args.csv:
+        lines.append(
+            f"CSV saved to: {csv_filename} (took {progress['csv_time']:.2f}s)"
+        )
+
+    sys.stdout.write("\n".join(lines) + "\n" + ENHANCEMENT_SUMMARY)
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":